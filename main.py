@@ -1,12 +1,16 @@
 import os
+import re
+import json
 import time
+import queue
+import atexit
+import asyncio
+import base64
 import logging
 import datetime
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-import openai
 
 # ---------------------------
 # Set up logging for debugging
@@ -14,209 +18,466 @@ import openai
 if not os.path.exists("logs"):
     os.makedirs("logs")
 log_filename = os.path.join("logs", f"debug_log_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="[%(asctime)s] %(levelname)s: %(message)s",
-    handlers=[
-        logging.FileHandler(log_filename),
-        logging.StreamHandler()
-    ]
-)
+# Records are handed to a background listener so file/console I/O never blocks the main thread.
+log_formatter = logging.Formatter("[%(asctime)s] %(levelname)s: %(message)s")
+log_handlers = [logging.FileHandler(log_filename), logging.StreamHandler()]
+for log_handler in log_handlers:
+    log_handler.setFormatter(log_formatter)
+log_queue = queue.Queue(-1)
+log_listener = QueueListener(log_queue, *log_handlers)
+log_listener.start()
+atexit.register(log_listener.stop)  # Flush queued records on every exit path
+root_logger = logging.getLogger()
+root_logger.setLevel(logging.DEBUG)
+root_logger.addHandler(QueueHandler(log_queue))
+
+# Screenshots are debug scaffolding; set DEBUG=1 to capture them.
+DEBUG = os.getenv("DEBUG", "").lower() in ("1", "true", "yes")
+screenshot_executor = ThreadPoolExecutor(max_workers=1)
+
+def write_screenshot(filename, data):
+    """Decode a base64 screenshot and write it to disk."""
+    with open(filename, "wb") as f:
+        f.write(base64.b64decode(data))
+    logging.info(f"Screenshot saved: {filename}")
 
 def capture_screenshot(driver, name):
-    """Capture a screenshot and save it to the 'screenshots' folder."""
+    """Capture a screenshot and save it to the 'screenshots' folder (DEBUG only)."""
+    if not DEBUG:
+        return
     if not os.path.exists("screenshots"):
         os.makedirs("screenshots")
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = os.path.join("screenshots", f"{name}_{timestamp}.png")
-    driver.save_screenshot(filename)
-    logging.info(f"Screenshot saved: {filename}")
+    filename = os.path.join("screenshots", f"{name}_{timestamp}.jpg")
+    # CDP hands back the encoded image directly; the disk write happens off the main thread.
+    result = driver.execute_cdp_cmd("Page.captureScreenshot", {"format": "jpeg", "quality": 60})
+    screenshot_executor.submit(write_screenshot, filename, result["data"])
 
 # ---------------------------
 # Overlay Functions
 # ---------------------------
+# Helper library registered with Page.addScriptToEvaluateOnNewDocument at startup,
+# so every page gets window.__aioverlay and window.__aihighlight compiled once and
+# later calls only ship a tiny call expression plus arguments.
+OVERLAY_JS_LIB = """
+window.__aihighlight = function (elements, color) {
+    [].concat(elements).forEach(function (e) {
+        e.style.border = '3px solid ' + color;
+    });
+};
+window.__aioverlay = window.__aioverlay || {
+    text: null,
+    set: function (text) {
+        if (text === this.text && document.getElementById('ai-overlay')) {
+            return;
+        }
+        var overlay = document.getElementById('ai-overlay');
+        if (!overlay) {
+            overlay = document.createElement('div');
+            overlay.id = 'ai-overlay';
+            overlay.style.position = 'fixed';
+            overlay.style.top = '0';
+            overlay.style.left = '0';
+            overlay.style.width = '100%';
+            overlay.style.height = '100%';
+            overlay.style.backgroundColor = 'rgba(0, 0, 0, 0.5)';
+            overlay.style.color = 'white';
+            overlay.style.fontSize = '24px';
+            overlay.style.display = 'flex';
+            overlay.style.alignItems = 'center';
+            overlay.style.justifyContent = 'center';
+            overlay.style.zIndex = '9999';
+            overlay.style.pointerEvents = 'none';
+            var box = document.createElement('div');
+            box.style.background = 'rgba(0,0,0,0.7)';
+            box.style.padding = '10px';
+            box.style.borderRadius = '5px';
+            overlay.appendChild(box);
+            document.body.appendChild(overlay);
+        }
+        overlay.firstChild.textContent = text;
+        this.text = text;
+    },
+    clear: function () {
+        var overlay = document.getElementById('ai-overlay');
+        if (overlay) {
+            overlay.parentNode.removeChild(overlay);
+        }
+        this.text = null;
+    }
+};
+"""
+
 def inject_overlay(text=""):
     """Inject a full-screen overlay with an initial status message."""
-    driver.execute_script("""
-    if (!document.getElementById('ai-overlay')) {
-        var overlay = document.createElement('div');
-        overlay.id = 'ai-overlay';
-        overlay.style.position = 'fixed';
-        overlay.style.top = '0';
-        overlay.style.left = '0';
-        overlay.style.width = '100%';
-        overlay.style.height = '100%';
-        overlay.style.backgroundColor = 'rgba(0, 0, 0, 0.5)';
-        overlay.style.color = 'white';
-        overlay.style.fontSize = '24px';
-        overlay.style.display = 'flex';
-        overlay.style.alignItems = 'center';
-        overlay.style.justifyContent = 'center';
-        overlay.style.zIndex = '9999';
-        overlay.style.pointerEvents = 'none';
-        document.body.appendChild(overlay);
-    }
-    """)
-    update_overlay(text)
+    driver.execute_script("window.__aioverlay.set(arguments[0]);", text)
 
 def update_overlay(text):
-    """Update the overlay text."""
-    driver.execute_script(f"""
-    var overlay = document.getElementById('ai-overlay');
-    if (overlay) {{
-        overlay.innerHTML = "<div style='background: rgba(0,0,0,0.7); padding: 10px; border-radius: 5px;'>{text}</div>";
-    }}
-    """)
+    """Update the overlay text (no-op if the overlay is not installed on this page)."""
+    driver.execute_script("if (window.__aioverlay) { window.__aioverlay.set(arguments[0]); }", text)
 
 def remove_overlay():
     """Remove the overlay from the page."""
-    driver.execute_script("""
-    var overlay = document.getElementById('ai-overlay');
-    if (overlay) {
-        overlay.parentNode.removeChild(overlay);
-    }
-    """)
+    driver.execute_script("if (window.__aioverlay) { window.__aioverlay.clear(); }")
 
 def scroll_page(pixels, overlay_text="Scrolling..."):
     """Scroll the page by the given number of pixels and update the overlay."""
     update_overlay(overlay_text)
+    # scrollBy is synchronous, so there is nothing to wait for here.
     driver.execute_script(f"window.scrollBy(0, {pixels});")
-    time.sleep(2)
     capture_screenshot(driver, "after_scroll")
 
 # ---------------------------
 # Load API key from environment variables
 # ---------------------------
 load_dotenv()
-openai.api_key = os.getenv("OPENAI_API_KEY")
-if not openai.api_key:
+openai_api_key = os.getenv("OPENAI_API_KEY")
+if not openai_api_key:
     logging.error("OpenAI API key not found. Please set it in the .env file.")
     exit(1)
 
+# The heavy openai/selenium imports are deferred until here so a misconfigured
+# run fails fast without paying for them.
+from openai import AsyncOpenAI
+OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+OPENAI_MAX_RETRIES = 3  # Retries on 429/5xx/connection errors, with exponential backoff
+# A transient API error would otherwise throw away every Selenium step that preceded it.
+client = AsyncOpenAI(api_key=openai_api_key, max_retries=OPENAI_MAX_RETRIES)
+
 # ---------------------------
 # Initialize Selenium WebDriver
 # ---------------------------
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
 options = Options()
 # For debugging, ensure the browser is visible (remove or comment out headless)
 # options.add_argument("--headless")
-driver = webdriver.Chrome(options=options)
+# Return from driver.get() at DOMContentLoaded; the explicit wait on the
+# survey question below guarantees the content we need is present.
+options.page_load_strategy = 'eager'
+# Persist the profile (and its 100 MB disk cache) so repeat navigations reuse cached
+# assets; cookies are cleared before each survey in main().
+CHROME_PROFILE_DIR = os.path.abspath(".chrome-profile")
+options.add_argument(f"--user-data-dir={CHROME_PROFILE_DIR}")
+options.add_argument("--disk-cache-size=104857600")
+# keep_alive reuses one HTTP connection to chromedriver for every command.
+driver = webdriver.Chrome(options=options, keep_alive=True)
 driver.maximize_window()  # Maximize window for better visibility
+driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": OVERLAY_JS_LIB})
+WAIT_TIMEOUT = 10  # Seconds to wait for the DOM before giving up
+wait = WebDriverWait(driver, WAIT_TIMEOUT)
+SURVEY_URLS = [
+    "https://www.ihdresearch.com/?cid=ddaf9592-e094-48e5-921e-3832003ba9ca&language=en",  # Replace with your actual survey URL(s)
+]
+FORM_CONTEXT_CHARS = 2000  # Max characters of form text sent to OpenAI as context
+ATTENTION_CHECK_RE = re.compile(r"select\s+[\"']?(\w+)[\"']?", re.IGNORECASE)
+CONDITION_RE = re.compile(r"\b(?:if|unless|when|whenever)\b", re.IGNORECASE)
 
 def highlight(element, color='red'):
     """Highlight a Selenium WebElement with a colored border for debugging."""
-    driver.execute_script(f"arguments[0].style.border='3px solid {color}'", element)
+    driver.execute_script("window.__aihighlight(arguments[0], arguments[1]);", element, color)
     logging.debug(f"Element highlighted with color {color}.")
 
-try:
+def highlight_options(options_list):
+    """Highlight every answer option, one screenshot per option in DEBUG mode."""
+    for idx, (_, text) in enumerate(options_list, start=1):
+        logging.info(f"Option {idx}: {text}")
+    if DEBUG:
+        for idx, (radio_input, _) in enumerate(options_list, start=1):
+            highlight(radio_input, color='blue')
+            capture_screenshot(driver, f"option_{idx}_highlighted")
+    else:
+        # Without per-option screenshots a single roundtrip can mark them all.
+        driver.execute_script(
+            "window.__aihighlight(arguments[0], arguments[1]);",
+            [radio_input for (radio_input, _) in options_list],
+            'blue',
+        )
+
+def local_choice(question_text, options_list):
+    """Return the option text for a question that needs no LLM call, or None."""
+    if len(options_list) == 1:
+        return options_list[0][1]
+    # Attention checks such as: Select "Blue" to show you are paying attention.
+    # Earlier matches such as "select one answer" name no option, so try them all.
+    for match in ATTENTION_CHECK_RE.finditer(question_text):
+        # 'If you have never smoked, select "No"' depends on the respondent, not on
+        # attention, so conditional instructions are left to the model.
+        sentence_start = max(question_text.rfind(mark, 0, match.start()) for mark in ".!?\n") + 1
+        sentence_ends = [question_text.find(mark, match.end()) for mark in ".!?\n"]
+        sentence_end = min([end for end in sentence_ends if end != -1], default=len(question_text))
+        if CONDITION_RE.search(question_text, sentence_start, sentence_end):
+            continue
+        for (_, text) in options_list:
+            if text.lower() == match.group(1).lower():
+                return text
+    return None
+
+def extract_json_array(content):
+    """Return the outermost [...] slice of content parsed as a list of option texts, or None."""
+    start, end = content.find("["), content.rfind("]")
+    if start == -1 or end < start:
+        return None
+    try:
+        choices = json.loads(content[start:end + 1])
+    except json.JSONDecodeError:
+        return None
+    # Prose such as "[1] Yes" or "Option [2]: No" also parses; only a list of option
+    # texts (null meaning unanswered) counts, so the bare-answer fallback still works.
+    if not isinstance(choices, list) or not any(isinstance(choice, str) for choice in choices):
+        return None
+    if not all(choice is None or isinstance(choice, str) for choice in choices):
+        return None
+    return choices
+
+def parse_choices(content, count):
+    """Parse the model's JSON array of chosen option texts, padded/truncated to one per question."""
+    choices = extract_json_array(content)
+    if choices is None:
+        # A lone question may still be answered with the bare option text, or with
+        # that text as a JSON string such as "Yes".
+        answer = content.strip()
+        try:
+            decoded = json.loads(answer)
+        except json.JSONDecodeError:
+            decoded = None
+        if isinstance(decoded, str):
+            answer = decoded
+        else:
+            logging.warning("OpenAI response did not contain a JSON array.")
+        choices = [answer] if count == 1 else []
+    choices = [choice.strip() if choice is not None else None for choice in choices]
+    return (choices + [None] * count)[:count]
+
+def is_complete_answer(content, count):
+    """Return True once content holds a parseable JSON array with an answer per question."""
+    choices = extract_json_array(content)
+    return choices is not None and len(choices) >= count
+
+async def request_choices(prompt, pending_options):
+    """Stream the completion and stop as soon as every pending question has an answer."""
+    stream = await client.chat.completions.create(
+        model=OPENAI_MODEL,
+        messages=[
+            {"role": "system", "content": "You are a survey-solving AI with a custom personality."},
+            {"role": "user", "content": prompt}
+        ],
+        temperature=0,
+        max_tokens=50 * len(pending_options),  # One short option per question, so cap generation time
+        stream=True,
+    )
+    content = ""
+    try:
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            content += chunk.choices[0].delta.content or ""
+            if is_complete_answer(content, len(pending_options)):
+                break
+            # A lone question may be answered with bare option text; act on the first full line.
+            if len(pending_options) == 1 and "\n" in content.strip():
+                # Quotes are dropped so a JSON-string reply like "Yes" still matches.
+                first_line = content.strip().splitlines()[0].strip().strip("\"'").strip().lower()
+                texts = [text for (_, text) in pending_options[0] if text]
+                exact = [text for text in texts if first_line == text.lower()]
+                # Otherwise prefer the longest prefix, so "Not sure" is not read as "No".
+                prefixes = sorted(
+                    (text for text in texts if first_line.startswith(text.lower())),
+                    key=len,
+                    reverse=True,
+                )
+                if exact or prefixes:
+                    return json.dumps([(exact or prefixes)[0]])
+    finally:
+        # Closing the stream early drops the remaining (usually explanatory) tokens.
+        await stream.close()
+    return content
+
+async def run(url):
+    """Answer the survey questions on a page, overlapping the OpenAI call with browser work."""
+    loop = asyncio.get_running_loop()
+
     # Step 1: Open the survey page and inject overlay
-    url = "https://www.ihdresearch.com/?cid=ddaf9592-e094-48e5-921e-3832003ba9ca&language=en"  # Replace with your actual survey URL
     logging.info(f"Navigating to URL: {url}")
     driver.get(url)
-    time.sleep(3)
+    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "p.survey-question")))
     capture_screenshot(driver, "page_loaded")
     inject_overlay("Page Loaded")
     
     # Optionally, scroll down if content is below the fold
     scroll_page(300, "Scrolling down to load content...")
 
-    # Step 2: Retrieve the full rendered HTML from the live DOM
-    # This is equivalent to what you'd see in the Chrome DevTools Elements tab.
-    rendered_html = driver.execute_script("return document.documentElement.outerHTML;")
-    logging.info("Rendered HTML retrieved from live DOM.")
-    update_overlay("Rendered HTML extracted")
-    capture_screenshot(driver, "rendered_html_retrieved")
-    time.sleep(2)
-
-    # Step 3: Locate and extract the survey question and answer options
-    # Adjust the selectors as needed. For this example, assume the question is in a <p> with class "survey-question".
-    question_element = driver.find_element(By.CSS_SELECTOR, "p.survey-question")
-    question_text = question_element.text.strip()
-    highlight(question_element, color='orange')
-    logging.info(f"Survey Question: {question_text}")
-    capture_screenshot(driver, "question_highlighted")
-    time.sleep(2)
-
-    option_inputs = driver.find_elements(By.CSS_SELECTOR, "input[type='radio']")
-    options_list = []
-    for radio_input in option_inputs:
-        radio_id = radio_input.get_attribute("id")
-        if radio_id:
-            try:
-                label_element = driver.find_element(By.CSS_SELECTOR, f"label[for='{radio_id}']")
-                option_text = label_element.text.strip()
-            except Exception as e:
-                logging.warning(f"Label for radio ID {radio_id} not found: {e}")
+    # Step 2: Retrieve a pruned text snippet of the survey form for context.
+    # The full outerHTML is mostly markup noise and inflates the prompt by orders of magnitude.
+    form_context = driver.execute_script(
+        "var form = document.querySelector('form');"
+        "return form ? form.innerText.slice(0, arguments[0]) : '';",
+        FORM_CONTEXT_CHARS,
+    )
+    logging.info(f"Form context retrieved from live DOM ({len(form_context)} chars).")
+    update_overlay("Form context extracted")
+    capture_screenshot(driver, "form_context_retrieved")
+
+    # Step 3: Locate and extract every survey question on the page and its answer options
+    # Adjust the selectors as needed. For this example, assume each question is in a <p> with class "survey-question".
+    # Questions, radios and labels are all gathered in-browser so discovery is a
+    # single WebDriver roundtrip; each radio belongs to the closest question before it.
+    # Labels are indexed by their "for" id in one pass rather than queried per radio;
+    # a Map keeps ids like "constructor" from colliding with Object.prototype.
+    question_data = driver.execute_script("""
+    var labels = new Map();
+    document.querySelectorAll('label[for]').forEach(function (l) {
+        if (!labels.has(l.htmlFor)) {
+            labels.set(l.htmlFor, l.innerText.trim());
+        }
+    });
+    var questions = Array.from(document.querySelectorAll('p.survey-question')).map(function (q) {
+        return {element: q, text: q.innerText.trim(), options: []};
+    });
+    if (!questions.length) {
+        return questions;
+    }
+    document.querySelectorAll("input[type='radio']").forEach(function (r) {
+        var owner = questions[0];
+        questions.forEach(function (q) {
+            if (q.element.compareDocumentPosition(r) & Node.DOCUMENT_POSITION_FOLLOWING) {
+                owner = q;
+            }
+        });
+        var text = r.id && labels.has(r.id) ? labels.get(r.id) : null;
+        owner.options.push({element: r, id: r.id, text: text});
+    });
+    return questions;
+    """)
+    if not question_data:
+        raise NoSuchElementException("No p.survey-question element on the page.")
+
+    survey_questions = []
+    for question in question_data:
+        options_list = []
+        for option in question["options"]:
+            if not option["id"]:
+                option_text = "(no id/label)"
+            elif option["text"] is None:
+                logging.warning(f"Label for radio ID {option['id']} not found.")
                 option_text = "(no label)"
-        else:
-            option_text = "(no id/label)"
-        options_list.append((radio_input, option_text))
-    
-    for idx, (radio_input, text) in enumerate(options_list, start=1):
-        logging.info(f"Option {idx}: {text}")
-        highlight(radio_input, color='blue')
-        capture_screenshot(driver, f"option_{idx}_highlighted")
-        time.sleep(1)
+            else:
+                option_text = option["text"]
+            options_list.append((option["element"], option_text))
+        logging.info(f"Survey Question: {question['text']}")
+        survey_questions.append((question["element"], question["text"], options_list))
+    driver.execute_script(
+        "window.__aihighlight(arguments[0], arguments[1]);",
+        [question_element for (question_element, _, _) in survey_questions],
+        'orange',
+    )
+    capture_screenshot(driver, "question_highlighted")
     
-    # Step 4: Prepare prompt for OpenAI using the rendered HTML plus survey details.
-    prompt = f"""
+    # Step 4: Answer trivial questions locally, then send one compact prompt to OpenAI
+    # covering only the questions that remain.
+    chosen_options = [
+        local_choice(question_text, options_list)
+        for (_, question_text, options_list) in survey_questions
+    ]
+    pending = [idx for idx, choice in enumerate(chosen_options) if choice is None]
+    all_options = [option for (_, _, options_list) in survey_questions for option in options_list]
+    if pending:
+        question_lines = "\n".join(
+            f"{num}. Survey Question: {survey_questions[idx][1]}\n   Options: {', '.join([txt for (_, txt) in survey_questions[idx][2]])}"
+            for num, idx in enumerate(pending, start=1)
+        )
+        prompt = f"""
 You are an AI with a custom personality designed to solve surveys.
-Note that you do not have access to the raw page source; you only see the live rendered HTML.
-Below is the rendered HTML of the page (as seen in the Chrome Elements panel):
-{rendered_html}
+Below is the visible text of the survey form, for context:
+{form_context}
 
-Additionally, here is the survey question and its available answer options:
-Survey Question: {question_text}
-Options: {', '.join([txt for (_, txt) in options_list])}
+Here are the survey questions and their available answer options:
+{question_lines}
 
-Respond with the exact text of the option you would choose.
+Respond with a JSON array containing, for each question in order, the exact text of the option you would choose.
 """
-    logging.info("Sending prompt to OpenAI.")
-    logging.debug(f"Prompt: {prompt}")
-    update_overlay("Processing Survey Question...")
-    response = openai.ChatCompletion.create(
-        model="gpt-3.5-turbo",
-        messages=[
-            {"role": "system", "content": "You are a survey-solving AI with a custom personality."},
-            {"role": "user", "content": prompt}
-        ]
-    )
-    chosen_option = response['choices'][0]['message']['content'].strip()
-    logging.info(f"AI Chose: {chosen_option}")
-    update_overlay(f"AI Chose: {chosen_option}")
+        logging.info(f"Sending prompt for {len(pending)} question(s) to OpenAI.")
+        logging.debug("Prompt length=%d", len(prompt))
+        update_overlay("Processing Survey Questions...")
+        # Start the request now and do the highlight/screenshot work while it is in flight.
+        completion_task = asyncio.create_task(
+            request_choices(prompt, [survey_questions[idx][2] for idx in pending])
+        )
+        await loop.run_in_executor(None, highlight_options, all_options)
+        content = await completion_task
+        for idx, choice in zip(pending, parse_choices(content, len(pending))):
+            chosen_options[idx] = choice
+    else:
+        logging.info("All questions answered locally; skipping OpenAI.")
+        highlight_options(all_options)
+    logging.info(f"AI Chose: {chosen_options}")
+    update_overlay(f"AI Chose: {'; '.join(str(choice) for choice in chosen_options)}")
     capture_screenshot(driver, "ai_choice_received")
-    time.sleep(2)
     
-    # Step 5: Match the AI's chosen option to one of the radio inputs and click it
-    found = False
-    for (radio_input, text) in options_list:
-        if text == chosen_option:
-            highlight(radio_input, color='green')
-            capture_screenshot(driver, "chosen_option_highlighted")
-            radio_input.click()
-            logging.info("Clicked on the chosen option.")
-            found = True
-            break
+    # Step 5: Match each of the AI's chosen options to one of its question's radio inputs
+    chosen_inputs = []
+    for (_, question_text, options_list), chosen_option in zip(survey_questions, chosen_options):
+        for (radio_input, text) in options_list:
+            if text == chosen_option:
+                chosen_inputs.append(radio_input)
+                break
+        else:
+            logging.warning(f"AI's chosen option was not found for question: {question_text}")
+            update_overlay("Chosen option not found!")
     
-    if not found:
-        logging.warning("AI's chosen option was not found among the available options.")
-        update_overlay("Chosen option not found!")
+    if DEBUG:
+        for idx, radio_input in enumerate(chosen_inputs, start=1):
+            highlight(radio_input, color='green')
+            capture_screenshot(driver, f"chosen_option_{idx}_highlighted")
     
-    # Step 6 (Optional): Click the "Next" button
-    try:
-        next_button = driver.find_element(By.XPATH, "//button[contains(text(), 'Next')]")
-        highlight(next_button, color='purple')
-        capture_screenshot(driver, "next_button_highlighted")
-        update_overlay("Clicking Next...")
-        next_button.click()
+    # Step 6: Click the chosen options and the (optional) "Next" button in one roundtrip
+    clicked_next = driver.execute_script("""
+    arguments[0].forEach(function (radio) {
+        radio.click();
+    });
+    var next = Array.from(document.querySelectorAll('button')).find(function (b) {
+        return b.textContent.includes('Next');
+    });
+    if (!next) {
+        return false;
+    }
+    if (window.__aioverlay) {
+        window.__aioverlay.set('Clicking Next...');
+    }
+    next.click();
+    return true;
+    """, chosen_inputs)
+    logging.info(f"Clicked {len(chosen_inputs)} chosen option(s).")
+    if clicked_next:
         logging.info("Clicked the Next button.")
-    except Exception as e:
-        logging.warning(f"Could not find the Next button: {e}")
+        # Wait for the current question to be replaced instead of sleeping blindly.
+        try:
+            wait.until(EC.staleness_of(survey_questions[0][0]))
+        except TimeoutException:
+            logging.warning("Page did not advance after clicking Next.")
+    else:
+        logging.warning("Could not find the Next button.")
         update_overlay("Next button not found!")
     
-    time.sleep(3)
     capture_screenshot(driver, "final_state")
     update_overlay("Process Completed")
 
+async def main():
+    """Answer every survey in SURVEY_URLS, reusing a single browser session."""
+    for url in SURVEY_URLS:
+        # Start each survey, including the first, with no cookies for any domain.
+        # delete_all_cookies() would only clear the current page's domain, and the
+        # persistent profile would otherwise carry cookies over from earlier runs.
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        await run(url)
+
+try:
+    asyncio.run(main())
 except Exception as e:
     logging.exception("An error occurred during execution:")
     update_overlay("An error occurred!")
@@ -224,3 +485,4 @@ except Exception as e:
 finally:
     logging.info("Closing browser...")
     driver.quit()
+    screenshot_executor.shutdown(wait=True)